@@ -10,36 +10,102 @@ Example:
 from __future__ import annotations
 
 import argparse
+import functools
+import http.client
 import json
 import os
+import queue
+import re
+import select
+import shutil
 import signal
 import sys
+import threading
 import time
 import urllib.parse
 import urllib.request
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed, wait
 from urllib.error import HTTPError, URLError
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
-def format_bytes(bytes_val: int) -> str:
+# Default read size for streaming downloads (see --chunk-kb)
+CHUNK_SIZE = 256 * 1024  # 256 KiB
+
+# Minimum seconds between progress bar redraws
+PROGRESS_INTERVAL = 0.1
+
+# Written bytes between page cache drop hints on large downloads
+CACHE_DROP_BYTES = 64 * 1024 * 1024  # 64 MiB
+
+# Chunks that may be queued between the socket reader and the disk writer
+WRITE_QUEUE_DEPTH = 8
+
+# Concurrent size probes for already-downloaded files (--check-size)
+PROBE_WORKERS = 8
+
+# Total size from a Content-Range header ("bytes 0-0/1234" or "bytes */1234")
+_CONTENT_RANGE_RE = re.compile(r"bytes (?:\d+-\d+|\*)/(\d+)")
+
+# Set on Ctrl+C; in-flight downloads check it between chunks and abort
+STOP = threading.Event()
+
+# Per-thread state for worker threads (each one keeps its own opener)
+_local = threading.local()
+
+# Serializes console output from concurrent downloads
+_print_lock = threading.Lock()
+
+
+def _print(*args, **kwargs) -> None:
+    """Thread-safe print() so lines from concurrent downloads don't interleave."""
+    with _print_lock:
+        print(*args, **kwargs)
+
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+def format_bytes(bytes_val: float) -> str:
     """Format bytes as human-readable string."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_val < 1024.0:
-            return f"{bytes_val:.2f} {unit}"
-        bytes_val /= 1024.0
-    return f"{bytes_val:.2f} TB"
+    # Each unit is 2**10 of the previous one, so the unit index falls out of the bit length
+    exp = min(max(int(bytes_val).bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_val / (1 << (exp * 10)):.2f} {_BYTE_UNITS[exp]}"
+
+
+@functools.lru_cache(maxsize=32)
+def _format_total(total: int) -> str:
+    """format_bytes() for a file's total size, which is constant across redraws."""
+    return format_bytes(total)
+
+
+# Pre-rendered bars for every fill level of the default 50-column bar
+_BAR_LENGTH = 50
+_BAR_CACHE = ['=' * i + '-' * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1)]
 
+# Carriage return to redraw the line, ANSI erase-to-end-of-line after it
+_LINE_START = '\r'
+_LINE_END = '\x1b[K'
 
-def print_progress_bar(downloaded: int, total: int, start_time: float, bar_length: int = 50) -> None:
-    """Print a progress bar for download status."""
+
+def print_progress_bar(downloaded: int, total: int, start_time: float, bar_length: int = _BAR_LENGTH, start_offset: int = 0) -> None:
+    """
+    Print a progress bar for download status.
+
+    start_time is a time.monotonic() value; start_offset is the number of
+    bytes already present when a resumed download began (excluded from speed).
+    """
     if total > 0:
         percent = (downloaded / total) * 100
-        filled_length = int(bar_length * downloaded // total)
-        bar = '=' * filled_length + '-' * (bar_length - filled_length)
+        filled_length = min(int(bar_length * downloaded // total), bar_length)
+        if bar_length == _BAR_LENGTH:
+            bar = _BAR_CACHE[filled_length]
+        else:
+            bar = '=' * filled_length + '-' * (bar_length - filled_length)
 
-        elapsed = time.time() - start_time
-        if elapsed > 0 and downloaded > 0:
-            speed = downloaded / elapsed
+        elapsed = time.monotonic() - start_time
+        if elapsed > 0 and downloaded > start_offset:
+            speed = (downloaded - start_offset) / elapsed
             eta = (total - downloaded) / speed if speed > 0 else 0
             eta_str = f"{int(eta)}s"
             speed_str = format_bytes(speed) + "/s"
@@ -47,15 +113,18 @@ def print_progress_bar(downloaded: int, total: int, start_time: float, bar_lengt
             eta_str = "?"
             speed_str = "?"
 
-        sys.stdout.write(f'\r      [{bar}] {percent:.1f}% {format_bytes(downloaded)}/{format_bytes(total)} {speed_str} ETA: {eta_str}')
-        sys.stdout.flush()
+        line = f'{_LINE_START}      [{bar}] {percent:.1f}% {format_bytes(downloaded)}/{_format_total(total)} {speed_str} ETA: {eta_str}{_LINE_END}'
     else:
         # Unknown total size
-        sys.stdout.write(f'\r      Downloaded: {format_bytes(downloaded)}')
-        sys.stdout.flush()
+        line = f'{_LINE_START}      Downloaded: {format_bytes(downloaded)}{_LINE_END}'
+
+    # One write per redraw; the flush is needed because a line without a
+    # newline stays buffered, and redraws are already throttled
+    sys.stdout.write(line)
+    sys.stdout.flush()
 
 
-def fetch_timelapse_archives(host: str, username: str, password: str, timeout: int = 60) -> List[str]:
+def fetch_timelapse_archives(host: str, username: str, password: str, timeout: int = 60, opener: Optional[urllib.request.OpenerDirector] = None) -> List[str]:
     """
     Fetch the list of timelapse archive URLs from the camera API.
 
@@ -64,6 +133,7 @@ def fetch_timelapse_archives(host: str, username: str, password: str, timeout: i
         username: Username for digest auth
         password: Password for digest auth
         timeout: HTTP timeout in seconds
+        opener: Digest-auth opener to use (default: the calling thread's opener)
 
     Returns:
         List of archive file URLs
@@ -71,11 +141,8 @@ def fetch_timelapse_archives(host: str, username: str, password: str, timeout: i
     # Build the archives API endpoint
     api_url = f"http://{host}/local/timelapseme/archives?_={int(time.time() * 1000)}"
 
-    # Set up HTTP Digest authentication
-    pm = urllib.request.HTTPPasswordMgrWithDefaultRealm()
-    pm.add_password(realm=None, uri=api_url, user=username, passwd=password)
-    auth_handler = urllib.request.HTTPDigestAuthHandler(pm)
-    opener = urllib.request.build_opener(auth_handler)
+    if opener is None:
+        opener = _thread_opener(host, username, password)
 
     try:
         req = urllib.request.Request(api_url, method="GET")
@@ -84,20 +151,21 @@ def fetch_timelapse_archives(host: str, username: str, password: str, timeout: i
             if status >= 400:
                 raise HTTPError(api_url, status, f"HTTP {status}", resp.headers, None)
 
-            # Read and parse JSON response
-            data = json.loads(resp.read().decode('utf-8'))
+            # json.load() accepts the response's bytes and detects their encoding
+            data = json.load(resp)
 
             # Parse the JSON to extract file URLs
             # Response format: list of objects with 'id' and 'filename' fields
+            # Download URL: archives?export={id}&file={filename}
             urls = []
             if isinstance(data, list):
-                for item in data:
-                    if isinstance(item, dict) and 'id' in item and 'filename' in item:
-                        archive_id = item['id']
-                        filename = item['filename']
-                        # Construct download URL: archives?export={id}&file={filename}
-                        download_url = f"http://{host}/local/timelapseme/archives?export={archive_id}&file={urllib.parse.quote(filename)}"
-                        urls.append(download_url)
+                base = f"http://{host}/local/timelapseme/archives?export="
+                quote = urllib.parse.quote
+                urls = [
+                    f"{base}{item['id']}&file={quote(item['filename'])}"
+                    for item in data
+                    if isinstance(item, dict) and 'id' in item and 'filename' in item
+                ]
 
             return urls
 
@@ -124,19 +192,159 @@ def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def get_remote_file_size(url: str, username: str, password: str, timeout: int = 60) -> Optional[int]:
+class _KeepAliveHandler(urllib.request.HTTPHandler):
+    """
+    HTTP handler that keeps one persistent connection per host.
+
+    urllib's stock handler sends "Connection: close" and opens a new TCP
+    connection for every request, including the second leg of each digest
+    challenge. This one leaves the connection open and reuses it for the next
+    request once the previous response has been fully read. Not thread-safe;
+    each thread's opener gets its own instance.
+    """
+
+    # Unread response bodies up to this size (e.g. a 401 challenge) are
+    # drained so the connection can be reused; larger ones are abandoned.
+    DRAIN_LIMIT = 64 * 1024
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._conns: Dict[str, Tuple[http.client.HTTPConnection, http.client.HTTPResponse]] = {}
+
+    def http_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        return self.do_open(http.client.HTTPConnection, req)
+
+    def _take_idle(self, host: str) -> Optional[http.client.HTTPConnection]:
+        """Return the idle connection for host, or None if there isn't a reusable one."""
+        conn, resp = self._conns.pop(host, (None, None))
+        if conn is None:
+            return None
+
+        if not resp.isclosed() and resp.length is not None and resp.length <= self.DRAIN_LIMIT:
+            try:
+                resp.read()
+            except (OSError, http.client.HTTPException):
+                pass
+
+        # Only reusable if the previous body was consumed exactly
+        if conn.sock is not None and not resp.will_close and not resp.chunked and resp.length == 0:
+            return conn
+        conn.close()
+        return None
+
+    def do_open(self, http_class, req, **http_conn_args):
+        host = req.host
+        if not host:
+            raise URLError('no host given')
+
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers = {name.title(): val for name, val in headers.items()}
+
+        h = self._take_idle(host)
+        reused = h is not None
+        if h is None:
+            h = http_class(host, timeout=req.timeout, **http_conn_args)
+            h.set_debuglevel(self._debuglevel)
+
+        while True:
+            try:
+                try:
+                    h.request(req.get_method(), req.selector, req.data, headers,
+                              encode_chunked=req.has_header('Transfer-encoding'))
+                except OSError as err:  # timeout error
+                    raise URLError(err)
+                r = h.getresponse()
+            except (URLError, ConnectionError) as err:
+                h.close()
+                # The server may have dropped an idle keep-alive connection;
+                # retry once on a fresh one
+                reason = err.reason if isinstance(err, URLError) else err
+                if reused and isinstance(reason, ConnectionError):
+                    reused = False
+                    continue
+                raise
+            except:
+                h.close()
+                raise
+            break
+
+        if not r.will_close:
+            self._conns[host] = (h, r)
+
+        r.url = req.get_full_url()
+        r.msg = r.reason
+        return r
+
+
+class _PreemptiveDigestAuthHandler(urllib.request.HTTPDigestAuthHandler):
+    """
+    Digest auth handler that answers the last challenge up front.
+
+    The stock handler only sends credentials after a 401, so every request
+    costs an extra round trip. This one remembers the most recent challenge
+    and signs new requests with it (incrementing the nonce count); if the
+    server has rotated its nonce it replies 401 and the normal retry applies.
+    """
+
+    def __init__(self, passwd=None) -> None:
+        super().__init__(passwd)
+        self._last_chal: Optional[Dict[str, str]] = None
+
+    def retry_http_digest_auth(self, req, auth):
+        token, challenge = auth.split(' ', 1)
+        self._last_chal = urllib.request.parse_keqv_list(filter(None, urllib.request.parse_http_list(challenge)))
+        return super().retry_http_digest_auth(req, auth)
+
+    def http_request(self, req):
+        if self._last_chal is not None and req.get_header(self.auth_header) is None:
+            try:
+                auth = self.get_authorization(req, self._last_chal)
+            except (ValueError, URLError):
+                auth = None
+            if auth:
+                req.add_unredirected_header(self.auth_header, f"Digest {auth}")
+        return req
+
+
+def _build_opener(host: str, username: str, password: str) -> urllib.request.OpenerDirector:
+    """
+    Build a digest-auth opener for http://{host}/ with a persistent connection.
+
+    The handlers keep per-connection and per-challenge state, so an opener
+    must only be used from one thread at a time.
+    """
+    pm = urllib.request.HTTPPasswordMgrWithDefaultRealm()
+    pm.add_password(realm=None, uri=f"http://{host}/", user=username, passwd=password)
+    auth_handler = _PreemptiveDigestAuthHandler(pm)
+    return urllib.request.build_opener(_KeepAliveHandler(), auth_handler)
+
+
+def _thread_opener(host: str, username: str, password: str) -> urllib.request.OpenerDirector:
+    """
+    Return the calling thread's opener, building it on first use.
+
+    Each worker builds one and reuses it (along with its open connection
+    and cached digest challenge) for every file.
+    """
+    opener = getattr(_local, "opener", None)
+    if opener is None:
+        opener = _build_opener(host, username, password)
+        _local.opener = opener
+    return opener
+
+
+def get_remote_file_size(url: str, username: str, password: str, timeout: int = 60, opener: Optional[urllib.request.OpenerDirector] = None) -> Optional[int]:
     """
     Get the remote file size using HEAD request with HTTP Digest authentication.
 
     Returns:
         File size in bytes, or None if Content-Length header is not available
     """
-    try:
-        pm = urllib.request.HTTPPasswordMgrWithDefaultRealm()
-        pm.add_password(realm=None, uri=url, user=username, passwd=password)
-        auth_handler = urllib.request.HTTPDigestAuthHandler(pm)
-        opener = urllib.request.build_opener(auth_handler)
+    if opener is None:
+        opener = _thread_opener(urllib.parse.urlsplit(url).netloc, username, password)
 
+    try:
         req = urllib.request.Request(url, method="HEAD")
         with opener.open(req, timeout=timeout) as resp:
             content_length = resp.headers.get("Content-Length")
@@ -147,7 +355,382 @@ def get_remote_file_size(url: str, username: str, password: str, timeout: int =
     return None
 
 
-def download_with_digest(url: str, username: str, password: str, out_path: str, timeout: int = 60, rate_limit_mbps: Optional[float] = None, max_retries: int = 3, retry_delay: int = 5, show_progress: bool = True) -> None:
+def _read_body(resp: http.client.HTTPResponse, n: int) -> bytes:
+    """resp.read(n), reporting a connection lost partway through the body as a retryable URLError."""
+    try:
+        return resp.read(n)
+    except (OSError, http.client.HTTPException) as e:
+        # Covers resets, timeouts and IncompleteRead from chunked bodies;
+        # urllib only wraps these when they happen before the headers arrive
+        raise URLError(e) from e
+
+
+class _CountingReader:
+    """File-like wrapper that reports the running byte count to a callback after each read."""
+
+    def __init__(self, raw, callback) -> None:
+        self.raw = raw
+        self.callback = callback
+        self.total = 0
+
+    def read(self, n: int = -1) -> bytes:
+        data = _read_body(self.raw, n)
+        if data:
+            self.total += len(data)
+            self.callback(self.total)
+        return data
+
+
+class _TokenBucket:
+    """
+    Token-bucket pacer for rate limiting.
+
+    Tokens (bytes) accrue at `rate` per second, capped at `burst`. Consuming
+    more than are available sleeps just long enough to cover the deficit,
+    so a slow chunk is never followed by a catch-up burst. Thread-safe, so
+    every download in a run (and every segment) can share one bucket.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = 0.0
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, n: int) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.tokens + (now - self.last) * self.rate, self.burst)
+            self.last = now
+            self.tokens -= n
+            if self.tokens >= 0:
+                return
+            delay = -self.tokens / self.rate
+            # The sleep pays off the deficit; start accruing again after it
+            self.tokens = 0.0
+            self.last = now + delay
+        time.sleep(delay)
+
+
+def _sync_data(fd: int) -> None:
+    """Flush fd's data to stable storage, skipping timestamp-only metadata where possible."""
+    if hasattr(os, "fdatasync"):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+
+def _fsync_dir(path: str) -> None:
+    """fsync the directory containing path so a rename into it survives a crash (POSIX only)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    # Best effort: the file is already in place, and some filesystems
+    # (e.g. CIFS, FUSE) reject fsync on a directory with EINVAL
+    try:
+        dir_fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def _drop_page_cache(fd: int) -> None:
+    """Hint that fd's pages won't be re-read soon so archives don't evict the page cache."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+class _BackgroundWriter:
+    """
+    File-like object whose write() hands chunks to a dedicated writer thread.
+
+    Lets the next socket read proceed while the previous chunk is written to
+    disk, which matters on slow USB/SD storage. The bounded queue applies
+    backpressure, so at most `depth` chunks are held in memory. The writer
+    thread also issues the periodic page cache drop hints.
+    """
+
+    def __init__(self, f, depth: int = WRITE_QUEUE_DEPTH) -> None:
+        self.f = f
+        self.error: Optional[BaseException] = None
+        self._queue: queue.Queue = queue.Queue(maxsize=depth)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        written = 0
+        last_drop = 0
+        while (chunk := self._queue.get()) is not None:
+            # After a failure keep draining so write() never blocks on a full queue
+            if self.error is not None:
+                continue
+            try:
+                self.f.write(chunk)
+                written += len(chunk)
+
+                # Periodically let the kernel drop already-written pages;
+                # dirty pages are ignored by the hint, so write them back first
+                if written - last_drop >= CACHE_DROP_BYTES:
+                    self.f.flush()
+                    _sync_data(self.f.fileno())
+                    _drop_page_cache(self.f.fileno())
+                    last_drop = written
+            except BaseException as e:
+                self.error = e
+
+    def write(self, data: bytes) -> int:
+        if self.error is not None:
+            raise self.error
+        self._queue.put(data)
+        return len(data)
+
+    def close(self) -> None:
+        """Wait until every queued chunk is written, re-raising any write error."""
+        self._queue.put(None)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+
+def _can_splice(resp: http.client.HTTPResponse) -> bool:
+    """Whether resp's body can be moved with splice(2): Linux, known length, not chunked."""
+    return hasattr(os, "splice") and not resp.chunked and bool(resp.length)
+
+
+def _splice_response(resp: http.client.HTTPResponse, out_fd: int, pos: int, chunk_size: int, timeout: float, on_progress) -> int:
+    """
+    Copy the rest of resp's body into out_fd at pos without passing it through userspace.
+
+    Body bytes http.client already buffered while parsing the headers are
+    written normally; the remainder goes socket -> pipe -> file with
+    splice(2). on_progress is called with the running byte count after each
+    transfer. Returns the number of bytes copied.
+    """
+    copied = 0
+
+    # Drain whatever is sitting in the response's read buffer first
+    buffered = resp.peek()
+    if buffered:
+        head = resp.read1(len(buffered))
+        os.pwrite(out_fd, head, pos)
+        copied += len(head)
+        on_progress(copied)
+
+    import fcntl  # POSIX-only; splice() itself is Linux-only
+
+    sock_fd = resp.fileno()
+    remaining = resp.length
+    pipe_r, pipe_w = os.pipe()
+    try:
+        # A pipe holds 64 KiB by default, which caps every splice() at that;
+        # size it to the chunk so each transfer takes two syscalls per chunk
+        if hasattr(fcntl, "F_SETPIPE_SZ"):
+            pipe_size = chunk_size
+            while pipe_size > 64 * 1024:
+                try:
+                    fcntl.fcntl(pipe_w, fcntl.F_SETPIPE_SZ, pipe_size)
+                    break
+                except OSError:
+                    # Over /proc/sys/fs/pipe-max-size for this user
+                    pipe_size //= 2
+
+        while remaining:
+            try:
+                n = os.splice(sock_fd, pipe_w, min(remaining, chunk_size), flags=os.SPLICE_F_MOVE)
+            except BlockingIOError:
+                # Sockets with a timeout are non-blocking underneath
+                if not select.select([sock_fd], [], [], timeout)[0]:
+                    raise URLError(TimeoutError("timed out"))
+                continue
+            except OSError as e:
+                # Connection reset and the like; retryable like a short read
+                raise URLError(e) from e
+            if n == 0:
+                raise URLError(f"connection closed with {remaining} bytes remaining")
+            remaining -= n
+
+            while n:
+                moved = os.splice(pipe_r, out_fd, n, offset_dst=pos + copied, flags=os.SPLICE_F_MOVE)
+                n -= moved
+                copied += moved
+            on_progress(copied)
+    finally:
+        os.close(pipe_r)
+        os.close(pipe_w)
+
+    return copied
+
+
+def _remove_partial(path: str) -> None:
+    """Delete a partial download, ignoring errors (including it not existing)."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass  # Ignore cleanup errors
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve size bytes for fd, falling back to a plain truncate where fallocate is unavailable."""
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except (AttributeError, OSError):
+        os.ftruncate(fd, size)
+
+
+def _download_range(url: str, username: str, password: str, fd: int, start: int, end: int, timeout: int, chunk_size: int, bucket: Optional[_TokenBucket], on_progress) -> bool:
+    """
+    Fetch bytes start..end (inclusive) of url and pwrite them into fd at the same offset.
+
+    Runs on a segment worker thread. Returns False if the server ignored the
+    Range header (replied 200 instead of 206) so the caller can fall back to
+    a single-stream download.
+    """
+    opener = _thread_opener(urllib.parse.urlsplit(url).netloc, username, password)
+    req = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"}, method="GET")
+
+    with opener.open(req, timeout=timeout) as resp:
+        if getattr(resp, "status", 200) != 206:
+            return False
+
+        offset = start
+        while True:
+            if STOP.is_set():
+                raise KeyboardInterrupt
+            chunk = _read_body(resp, chunk_size)
+            if not chunk:
+                break
+            # pwrite() is positional, so segments can share one descriptor
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+            on_progress(len(chunk))
+
+            # Apply rate limiting
+            if bucket:
+                bucket.consume(len(chunk))
+
+    if offset != end + 1:
+        raise URLError(f"short read for bytes {start}-{end} (got {offset - start} bytes)")
+    return True
+
+
+def _download_segmented(url: str, username: str, password: str, tmp_path: str, total_size: int, segments: int, timeout: int, chunk_size: int, bucket: Optional[_TokenBucket], show_progress: bool, segment_pool: Optional[Executor] = None) -> bool:
+    """
+    Download url into tmp_path as `segments` concurrent byte ranges.
+
+    Ranges run on segment_pool if given, so its worker threads (and their
+    keep-alive connections) are reused across files; otherwise a temporary
+    pool is created for this file.
+
+    Returns False (leaving tmp_path for the caller to discard) if the server
+    does not honour range requests.
+    """
+    ranges = [(i * total_size // segments, ((i + 1) * total_size // segments) - 1) for i in range(segments)]
+
+    progress_lock = threading.Lock()
+    start_time = time.monotonic()
+    last_render = 0.0
+    downloaded = 0
+
+    def on_progress(n: int) -> None:
+        nonlocal downloaded, last_render
+        with progress_lock:
+            downloaded += n
+            now = time.monotonic()
+            if show_progress and (now - last_render >= PROGRESS_INTERVAL or downloaded == total_size):
+                with _print_lock:
+                    print_progress_bar(downloaded, total_size, start_time)
+                last_render = now
+
+    own_pool = segment_pool is None
+    if own_pool:
+        segment_pool = ThreadPoolExecutor(max_workers=segments)
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        _preallocate(fd, total_size)
+        futs = [
+            segment_pool.submit(_download_range, url, username, password, fd, a, b, timeout, chunk_size, bucket, on_progress)
+            for a, b in ranges
+        ]
+        # Every range must finish before fd is closed, even if one has failed
+        wait(futs)
+        results = [fut.result() for fut in futs]
+        if all(results):
+            # Commit the data before the caller renames the file into place;
+            # the pages are clean afterwards, so the cache hint can drop them
+            _sync_data(fd)
+            _drop_page_cache(fd)
+    finally:
+        os.close(fd)
+        if own_pool:
+            segment_pool.shutdown()
+
+    if show_progress:
+        sys.stdout.write('\n')
+        sys.stdout.flush()
+
+    return all(results)
+
+
+def get_size_and_maybe_resume(url: str, username: str, password: str, local_size: int, timeout: int = 60, opener: Optional[urllib.request.OpenerDirector] = None) -> Tuple[Optional[int], bool, int]:
+    """
+    Compare a local copy against the remote file using a one-byte ranged GET.
+
+    The total size comes from the Content-Range header of a "bytes=0-0"
+    request, which avoids a separate HEAD round trip and also tells us
+    whether the server supports resuming.
+
+    Returns:
+        (total, need_download, start_offset): total is None if the remote size
+        is unknown; start_offset is where to resume from (0 to start over)
+    """
+    if opener is None:
+        opener = _thread_opener(urllib.parse.urlsplit(url).netloc, username, password)
+
+    req = urllib.request.Request(url, headers={"Range": "bytes=0-0"}, method="GET")
+    try:
+        with opener.open(req, timeout=timeout) as resp:
+            status = getattr(resp, "status", 200)
+            if status == 206:
+                match = _CONTENT_RANGE_RE.match(resp.headers.get("Content-Range", ""))
+                total = int(match.group(1)) if match else None
+                # Consume the single byte so the connection can be reused
+                resp.read()
+                can_resume = total is not None
+            else:
+                # Range ignored; the full body is abandoned on close
+                content_length = resp.headers.get("Content-Length")
+                total = int(content_length) if content_length else None
+                can_resume = False
+    except HTTPError as e:
+        # An empty remote file can't satisfy bytes=0-0
+        match = _CONTENT_RANGE_RE.match(e.headers.get("Content-Range", "")) if e.code == 416 and e.headers else None
+        if not match:
+            return None, False, 0
+        total = int(match.group(1))
+        can_resume = False
+    except (OSError, http.client.HTTPException, ValueError):
+        # OSError covers URLError as well as errors from getresponse()
+        # (RemoteDisconnected, timeouts) that urllib doesn't wrap; any of
+        # them just means the size is unknown
+        return None, False, 0
+
+    if total is None or total == local_size:
+        return total, False, 0
+    if can_resume and 0 < local_size < total:
+        return total, True, local_size
+    return total, True, 0
+
+
+def download_with_digest(url: str, username: str, password: str, out_path: str, timeout: int = 60, rate_limit_mbps: Optional[float] = None, max_retries: int = 3, retry_delay: int = 5, show_progress: bool = True, opener: Optional[urllib.request.OpenerDirector] = None, segments: int = 1, segment_pool: Optional[Executor] = None, chunk_size: int = CHUNK_SIZE, resume_from: int = 0, zero_copy: bool = False, bucket: Optional[_TokenBucket] = None) -> None:
     """
     Download a URL using HTTP Digest authentication and stream to out_path.
 
@@ -161,27 +744,75 @@ def download_with_digest(url: str, username: str, password: str, out_path: str,
         max_retries: Maximum number of retry attempts for failed downloads
         retry_delay: Delay in seconds between retry attempts
         show_progress: Show progress bar during download
+        opener: Digest-auth opener to use (default: the calling thread's opener)
+        segments: Number of concurrent byte-range requests to split the file into
+        segment_pool: Optional executor shared across files for segment downloads
+        chunk_size: Bytes to read from the socket per iteration
+        resume_from: Keep the first resume_from bytes of the existing out_path
+            and request only the rest
+        zero_copy: On Linux, move single-stream bodies from socket to file with splice(2)
+        bucket: Rate limiter shared with other downloads; takes the place of rate_limit_mbps
     """
     last_error = None
     tmp_path = out_path + ".part"
 
-    for attempt in range(max_retries):
-        try:
-            # Clean up any existing partial file from previous failed attempts
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-
-            # Build a password manager / auth handler for digest auth
-            pm = urllib.request.HTTPPasswordMgrWithDefaultRealm()
-            # Use the full URL as the "top-level URL" for credential matching
-            pm.add_password(realm=None, uri=url, user=username, passwd=password)
+    if opener is None:
+        opener = _thread_opener(urllib.parse.urlsplit(url).netloc, username, password)
 
-            auth_handler = urllib.request.HTTPDigestAuthHandler(pm)
+    # Rate limiting setup: convert Mbps to bytes per second and allow a burst
+    # of up to two chunks. Segments and retries all draw from this bucket.
+    if bucket is None and rate_limit_mbps:
+        bucket = _TokenBucket((rate_limit_mbps * 1_000_000) / 8, 2 * chunk_size)
 
-            # Build an opener for this request (keeps it simple per-call)
-            opener = urllib.request.build_opener(auth_handler)
+    # Clean up any stale partial file, or adopt the existing file as the
+    # partial file when resuming
+    try:
+        os.remove(tmp_path)
+    except FileNotFoundError:
+        pass
+    if resume_from:
+        os.replace(out_path, tmp_path)
+
+    def abandon() -> None:
+        # A resumed file started out as the user's copy; hand it back
+        # (holding whatever was added to it) instead of deleting it
+        if resume_from:
+            try:
+                os.replace(tmp_path, out_path)
+            except FileNotFoundError:
+                pass
+        else:
+            _remove_partial(tmp_path)
 
-            req = urllib.request.Request(url, method="GET")
+    for attempt in range(max_retries):
+        try:
+            # Bytes already on disk from resume_from or a failed attempt
+            try:
+                offset = os.stat(tmp_path).st_size
+            except FileNotFoundError:
+                offset = 0
+
+            # Segmented download when the size is known; falls through to a
+            # single stream if the server doesn't support range requests
+            if segments > 1 and offset == 0:
+                total_size = get_remote_file_size(url, username, password, timeout=timeout, opener=opener)
+                if total_size:
+                    # Don't split into segments smaller than one chunk
+                    n = min(segments, max(1, total_size // chunk_size))
+                    try:
+                        done = n > 1 and _download_segmented(url, username, password, tmp_path, total_size, n, timeout, chunk_size, bucket, show_progress, segment_pool)
+                    except BaseException:
+                        # A preallocated segment file has holes, so it can't be resumed from
+                        _remove_partial(tmp_path)
+                        raise
+                    if done:
+                        os.replace(tmp_path, out_path)
+                        _fsync_dir(out_path)
+                        return
+                    _remove_partial(tmp_path)
+
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            req = urllib.request.Request(url, headers=headers, method="GET")
 
             with opener.open(req, timeout=timeout) as resp:
                 # Basic success check
@@ -189,58 +820,100 @@ def download_with_digest(url: str, username: str, password: str, out_path: str,
                 if status >= 400:
                     raise HTTPError(url, status, f"HTTP {status}", resp.headers, None)
 
+                # Server ignored the Range header; start over
+                if status != 206:
+                    offset = 0
+
                 # Get total file size from Content-Length header
                 content_length = resp.headers.get("Content-Length")
-                total_size = int(content_length) if content_length else 0
+                total_size = offset + int(content_length) if content_length else 0
 
                 # Stream to disk
                 # Use a temp file then atomic rename to avoid partial files on interruption
-                # Rate limiting setup
-                chunk_size = 1024 * 1024  # 1 MiB
-                if rate_limit_mbps:
-                    # Convert Mbps to bytes per second
-                    max_bytes_per_sec = (rate_limit_mbps * 1_000_000) / 8
-
-                with open(tmp_path, "wb") as f:
-                    start_time = time.time()
-                    total_bytes = 0
-
-                    while True:
-                        chunk = resp.read(chunk_size)
-                        if not chunk:
-                            break
-                        f.write(chunk)
-                        total_bytes += len(chunk)
-
-                        # Show progress bar
-                        if show_progress:
-                            print_progress_bar(total_bytes, total_size, start_time)
 
-                        # Apply rate limiting
-                        if rate_limit_mbps:
-                            elapsed = time.time() - start_time
-                            expected_time = total_bytes / max_bytes_per_sec
+                # Writes are whole chunks, so a chunk-sized buffer never holds
+                # a partial copy of the data
+                with open(tmp_path, "r+b" if offset else "wb", buffering=chunk_size) as f:
+                    f.seek(offset)
+                    f.truncate()
+
+                    # Reserve the full size up front to limit fragmentation
+                    if total_size:
+                        _preallocate(f.fileno(), total_size)
+
+                    start_time = time.monotonic()
+                    last_render = 0.0
+                    last_bytes = 0
+
+                    def on_progress(total_bytes: int) -> None:
+                        nonlocal last_render, last_bytes
+
+                        # Abort promptly on Ctrl+C instead of finishing the file
+                        if STOP.is_set():
+                            raise KeyboardInterrupt
 
-                            if elapsed < expected_time:
-                                time.sleep(expected_time - elapsed)
+                        # Show progress bar, redrawing at most every PROGRESS_INTERVAL
+                        if show_progress:
+                            now = time.monotonic()
+                            if now - last_render >= PROGRESS_INTERVAL:
+                                print_progress_bar(offset + total_bytes, total_size, start_time, start_offset=offset)
+                                last_render = now
 
-                # Clear progress bar and print newline
+                        # Apply rate limiting
+                        if bucket:
+                            bucket.consume(total_bytes - last_bytes)
+                        last_bytes = total_bytes
+
+                    spliced = zero_copy and _can_splice(resp)
+                    try:
+                        if spliced:
+                            # Kernel-side copy at explicit offsets, bypassing f's buffer
+                            f.flush()
+                            copied = _splice_response(resp, f.fileno(), offset, chunk_size, timeout, on_progress)
+                        else:
+                            # Socket reads happen here; disk writes on the writer thread
+                            reader = _CountingReader(resp, on_progress)
+                            writer = _BackgroundWriter(f)
+                            try:
+                                shutil.copyfileobj(reader, writer, chunk_size)
+                            finally:
+                                # Queued chunks are valid data; write them before touching f
+                                writer.close()
+                            copied = reader.total
+
+                        # read() reports a body cut short as a normal end of
+                        # stream, which would leave a zero-filled preallocated tail
+                        if total_size and offset + copied != total_size:
+                            raise URLError(f"short read (got {offset + copied} of {total_size} bytes)")
+                    except BaseException:
+                        # Cut off the preallocated tail so a retry resumes
+                        # from the end of the data actually written (splice
+                        # doesn't move f's position, but only reports bytes
+                        # once they are in the file)
+                        f.truncate(offset + last_bytes if spliced else None)
+                        raise
+                    total_bytes = offset + copied
+
+                    # Commit the data before the rename below; the pages are
+                    # clean afterwards, so the cache hint can drop them
+                    f.flush()
+                    _sync_data(f.fileno())
+                    _drop_page_cache(f.fileno())
+
+                # Final redraw so the bar ends at 100%, then newline
                 if show_progress:
+                    print_progress_bar(total_bytes, total_size, start_time, start_offset=offset)
                     sys.stdout.write('\n')
                     sys.stdout.flush()
 
-                # Atomic rename: only happens if download completed successfully
+                # Atomic rename: only happens if download completed successfully,
+                # then make the new directory entry durable too
                 os.replace(tmp_path, out_path)
+                _fsync_dir(out_path)
                 return  # Success, exit the function
 
         except (HTTPError, URLError) as e:
             last_error = e
-            # Clean up partial file on error
-            if os.path.exists(tmp_path):
-                try:
-                    os.remove(tmp_path)
-                except OSError:
-                    pass  # Ignore cleanup errors
 
             # Check if it's a retryable error
             is_retryable = False
@@ -252,19 +925,21 @@ def download_with_digest(url: str, username: str, password: str, out_path: str,
                 is_retryable = True
 
             if is_retryable and attempt < max_retries - 1:
-                print(f"      Attempt {attempt + 1}/{max_retries} failed: {e}", file=sys.stderr)
-                print(f"      Retrying in {retry_delay} seconds...", file=sys.stderr)
-                time.sleep(retry_delay)
+                # Keep the partial file; the next attempt resumes from it.
+                # Name the file, since other downloads may be printing too
+                fname = os.path.basename(out_path)
+                _print(f"      Attempt {attempt + 1}/{max_retries} for {fname} failed: {e}\n"
+                       f"      Retrying {fname} in {retry_delay} seconds...", file=sys.stderr)
+                if STOP.wait(retry_delay):
+                    abandon()
+                    raise KeyboardInterrupt
             else:
                 # Last attempt or non-retryable error
+                abandon()
                 raise
-        except Exception:
-            # Clean up partial file on any exception
-            if os.path.exists(tmp_path):
-                try:
-                    os.remove(tmp_path)
-                except OSError:
-                    pass  # Ignore cleanup errors
+        except (Exception, KeyboardInterrupt):
+            # Clean up partial file on any exception or cancellation
+            abandon()
             # Non-retryable exceptions, re-raise immediately
             raise
 
@@ -273,19 +948,137 @@ def download_with_digest(url: str, username: str, password: str, out_path: str,
         raise last_error
 
 
+def _probe_existing(urls: List[str], args: argparse.Namespace) -> Dict[str, Tuple[Optional[int], bool, int]]:
+    """
+    Run get_size_and_maybe_resume() for every URL whose file already exists.
+
+    The probes run PROBE_WORKERS at a time, up front, so a re-run over a
+    mostly complete directory doesn't pay one sequential round trip per file
+    before new downloads start. Returns the results keyed by URL.
+    """
+    existing = []
+    for url in urls:
+        try:
+            st = os.stat(os.path.join(args.outdir, filename_from_url(url)))
+        except FileNotFoundError:
+            continue
+        existing.append((url, st.st_size))
+
+    def probe(item: Tuple[str, int]) -> Tuple[Optional[int], bool, int]:
+        url, local_size = item
+        # After Ctrl+C, skip the remaining probes; _process_one cancels the URLs
+        if STOP.is_set():
+            return None, False, 0
+        opener = _thread_opener(args.host, args.user, args.password)
+        return get_size_and_maybe_resume(url, args.user, args.password, local_size, timeout=args.timeout, opener=opener)
+
+    if not existing:
+        return {}
+    with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as ex:
+        return dict(zip((url for url, _ in existing), ex.map(probe, existing)))
+
+
+def _process_one(url: str, args: argparse.Namespace, segment_pool: Optional[Executor] = None, probes: Optional[Dict[str, Tuple[Optional[int], bool, int]]] = None, bucket: Optional[_TokenBucket] = None) -> str:
+    """
+    Download (or skip) a single archive URL.
+
+    Runs on a worker thread. Returns "ok", "skipped", "failed" or
+    "cancelled". probes holds precomputed get_size_and_maybe_resume()
+    results from _probe_existing(); bucket is the run-wide rate limiter.
+    """
+    # The progress bar only makes sense when one download owns a terminal;
+    # redirected output would just collect carriage returns
+    show_progress = not args.no_progress and args.concurrency == 1 and sys.stdout.isatty()
+
+    if STOP.is_set():
+        return "cancelled"
+
+    resume_from = 0
+    try:
+        opener = _thread_opener(args.host, args.user, args.password)
+        fname = filename_from_url(url)
+        out_path = os.path.join(args.outdir, fname)
+
+        # One stat() answers both "does it exist" and "how big is it"
+        try:
+            st = os.stat(out_path)
+        except FileNotFoundError:
+            st = None
+
+        if st is not None and not args.overwrite:
+            # Check file size if requested
+            if args.check_size:
+                local_size = st.st_size
+                if probes and url in probes:
+                    remote_size, need_download, resume_from = probes[url]
+                else:
+                    remote_size, need_download, resume_from = get_size_and_maybe_resume(url, args.user, args.password, local_size, timeout=args.timeout, opener=opener)
+
+                if remote_size is None:
+                    # Cannot determine remote size, skip anyway
+                    _print(f"SKIP  {fname} (already exists, cannot verify size)")
+                    return "skipped"
+                elif not need_download:
+                    _print(f"SKIP  {fname} (already exists, size matches: {local_size} bytes)")
+                    return "skipped"
+                elif resume_from:
+                    _print(f"INFO  {fname} is incomplete (local: {local_size}, remote: {remote_size}), resuming")
+                else:
+                    _print(f"INFO  {fname} exists but size mismatch (local: {local_size}, remote: {remote_size}), re-downloading")
+            else:
+                # No size check, skip based on existence only
+                _print(f"SKIP  {fname} (already exists)")
+                return "skipped"
+
+        _print(f"GET   {url}\nSAVE  {out_path}")
+        download_with_digest(
+            url,
+            args.user,
+            args.password,
+            out_path,
+            timeout=args.timeout,
+            rate_limit_mbps=args.rate_limit,
+            max_retries=args.max_retries,
+            retry_delay=args.retry_delay,
+            show_progress=show_progress,
+            opener=opener,
+            segments=args.segments,
+            segment_pool=segment_pool,
+            chunk_size=args.chunk_kb * 1024,
+            resume_from=resume_from,
+            zero_copy=args.zero_copy,
+            bucket=bucket
+        )
+        if not show_progress:
+            _print(f"DONE  {fname}")
+        return "ok"
+
+    except KeyboardInterrupt:
+        outcome = "existing file kept" if resume_from else "partial file removed"
+        _print(f"STOP  {url} (cancelled, {outcome})", file=sys.stderr)
+        return "cancelled"
+    except (HTTPError, URLError) as e:
+        _print(f"FAIL  {url}\n      {e}", file=sys.stderr)
+        return "failed"
+    except Exception as e:
+        _print(f"FAIL  {url}\n      {type(e).__name__}: {e}", file=sys.stderr)
+        return "failed"
+
+
 def main() -> int:
     # Set up signal handler for graceful exit on Ctrl+C
-    interrupted = False
+    STOP.clear()
 
     def signal_handler(signum, frame):
-        nonlocal interrupted
-        if not interrupted:
-            interrupted = True
+        if not STOP.is_set():
+            # Worker threads see this between chunks and abort their downloads
+            STOP.set()
             print("\n\nInterrupted by user (Ctrl+C). Cleaning up and exiting gracefully...", file=sys.stderr)
             print("Press Ctrl+C again to force exit.", file=sys.stderr)
         else:
             print("\nForce exit!", file=sys.stderr)
-            sys.exit(130)
+            # sys.exit() would wait for the worker threads to finish
+            os._exit(130)
 
     signal.signal(signal.SIGINT, signal_handler)
 
@@ -301,14 +1094,28 @@ def main() -> int:
     ap.add_argument("--check-size", action="store_true", help="Check remote file size before skipping existing files (default: false)")
     ap.add_argument("--no-progress", action="store_true", help="Disable progress bar display (default: show progress)")
     ap.add_argument("--overwrite", action="store_true", help="Overwrite existing files (default: skip existing)")
+    ap.add_argument("--concurrency", type=int, default=4, help="Number of files to download in parallel (default: 4)")
+    ap.add_argument("--segments", type=int, default=1, help="Split each file into N parallel byte-range requests (default: 1)")
+    ap.add_argument("--zero-copy", action="store_true", help="Move data from socket to file with splice(2) on Linux (default: false)")
+    ap.add_argument("--chunk-kb", type=int, default=CHUNK_SIZE // 1024, help=f"Read size per iteration in KiB (default: {CHUNK_SIZE // 1024})")
     args = ap.parse_args()
 
+    if args.concurrency < 1:
+        ap.error("--concurrency must be at least 1")
+    if args.segments < 1:
+        ap.error("--segments must be at least 1")
+    if args.chunk_kb < 1:
+        ap.error("--chunk-kb must be at least 1")
+    if args.rate_limit < 0:
+        ap.error("--rate-limit must be non-negative")
+
     ensure_dir(args.outdir)
 
     # Fetch timelapse archives from camera API
     print(f"Fetching timelapse archives from {args.host}...")
     try:
-        urls = fetch_timelapse_archives(args.host, args.user, args.password, timeout=args.timeout)
+        opener = _build_opener(args.host, args.user, args.password)
+        urls = fetch_timelapse_archives(args.host, args.user, args.password, timeout=args.timeout, opener=opener)
     except Exception as e:
         print(f"ERROR: Failed to fetch archives: {e}", file=sys.stderr)
         return 2
@@ -323,62 +1130,45 @@ def main() -> int:
     skipped = 0
     failed = 0
 
-    for url in urls:
-        # Check if interrupted by Ctrl+C
-        if interrupted:
-            print("\nStopping download process...", file=sys.stderr)
-            break
-
-        try:
-            fname = filename_from_url(url)
-            out_path = os.path.join(args.outdir, fname)
-
-            if os.path.exists(out_path) and not args.overwrite:
-                # Check file size if requested
-                if args.check_size:
-                    local_size = os.path.getsize(out_path)
-                    remote_size = get_remote_file_size(url, args.user, args.password, timeout=args.timeout)
-
-                    if remote_size is not None:
-                        if local_size == remote_size:
-                            print(f"SKIP  {fname} (already exists, size matches: {local_size} bytes)")
-                            skipped += 1
-                            continue
-                        else:
-                            print(f"INFO  {fname} exists but size mismatch (local: {local_size}, remote: {remote_size}), re-downloading")
-                    else:
-                        # Cannot determine remote size, skip anyway
-                        print(f"SKIP  {fname} (already exists, cannot verify size)")
-                        skipped += 1
-                        continue
-                else:
-                    # No size check, skip based on existence only
-                    print(f"SKIP  {fname} (already exists)")
-                    skipped += 1
-                    continue
-
-            print(f"GET   {url}")
-            print(f"SAVE  {out_path}")
-            download_with_digest(
-                url,
-                args.user,
-                args.password,
-                out_path,
-                timeout=args.timeout,
-                rate_limit_mbps=args.rate_limit,
-                max_retries=args.max_retries,
-                retry_delay=args.retry_delay,
-                show_progress=not args.no_progress
-            )
-            ok += 1
-
-        except (HTTPError, URLError) as e:
-            print(f"FAIL  {url}\n      {e}", file=sys.stderr)
-            failed += 1
-        except Exception as e:
-            print(f"FAIL  {url}\n      {type(e).__name__}: {e}", file=sys.stderr)
-            failed += 1
-
+    # Segment downloads share one bounded pool for the whole run, capping the
+    # total number of connections at concurrency * segments
+    segment_pool = ThreadPoolExecutor(max_workers=args.concurrency * args.segments) if args.segments > 1 else None
+
+    # One rate limiter for the whole run: workers share the limit, so a lone
+    # remaining download can use all of it
+    chunk_size = args.chunk_kb * 1024
+    bucket = _TokenBucket((args.rate_limit * 1_000_000) / 8, 2 * chunk_size) if args.rate_limit else None
+
+    # Check the sizes of files that already exist all at once, up front
+    probes = _probe_existing(urls, args) if args.check_size and not args.overwrite else None
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as ex:
+        futs = {ex.submit(_process_one, url, args, segment_pool, probes, bucket): url for url in urls}
+        cancelled = False
+
+        for fut in as_completed(futs):
+            # Check if interrupted by Ctrl+C; running downloads abort themselves
+            if STOP.is_set() and not cancelled:
+                print("\nStopping download process...", file=sys.stderr)
+                for pending in futs:
+                    pending.cancel()
+                cancelled = True
+
+            if fut.cancelled():
+                continue
+
+            result = fut.result()
+            if result == "ok":
+                ok += 1
+            elif result == "skipped":
+                skipped += 1
+            elif result == "failed":
+                failed += 1
+
+    if segment_pool is not None:
+        segment_pool.shutdown()
+
+    interrupted = STOP.is_set()
     status_msg = "Interrupted" if interrupted else "Done"
     print(f"\n{status_msg}. downloaded={ok} skipped={skipped} failed={failed}")
 
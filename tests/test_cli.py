@@ -0,0 +1,45 @@
+import argparse
+import os
+import socketserver
+import tempfile
+import threading
+import unittest
+
+from timelapse2_dl import cli
+
+
+class _DropHandler(socketserver.StreamRequestHandler):
+    """Reads the request line and closes the connection without replying."""
+
+    def handle(self):
+        self.rfile.readline()
+
+
+class ProbeDroppedConnectionTest(unittest.TestCase):
+    def setUp(self):
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _DropHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.host = "127.0.0.1:%d" % self.server.server_address[1]
+        self.url = f"http://{self.host}/local/timelapseme/archives?export=0&file=a.mkv"
+        cli.STOP.clear()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_get_size_reports_unknown(self):
+        opener = cli._build_opener(self.host, "u", "p")
+        result = cli.get_size_and_maybe_resume(self.url, "u", "p", 10, timeout=5, opener=opener)
+        self.assertEqual(result, (None, False, 0))
+
+    def test_probe_existing_survives(self):
+        with tempfile.TemporaryDirectory() as outdir:
+            with open(os.path.join(outdir, "a.mkv"), "wb") as f:
+                f.write(b"x" * 10)
+            args = argparse.Namespace(outdir=outdir, host=self.host, user="u", password="p", timeout=5)
+            self.assertEqual(cli._probe_existing([self.url], args), {self.url: (None, False, 0)})
+
+
+if __name__ == "__main__":
+    unittest.main()